@@ -71,6 +71,8 @@ class PokerEnum(_OrderableMixin, enum.Enum, metaclass=_PokerEnumMeta):
 
 
 class _ReprMixin:
+    __slots__ = ()
+
     def __repr__(self):
         return f"{self.__class__.__name__}('{self}')"
 
@@ -1,5 +1,8 @@
-import collections
+import functools
 import itertools
+import math
+import weakref
+from cached_property import cached_property
 from ._common import _ReprMixin
 from .card import Rank, Card, Suit
 
@@ -10,24 +13,221 @@ __all__ = [
 RANKING_NAMES = ("high_card", "pair", "two_pair", "three_of_a_kind", "straight", "flush", "full_house",
                  "four_of_a_kind", "straight_flush")
 
+# properties cached on the instance, which need to be recalculated when cards are added
+# (flop is cached too, but adding cards doesn't change it)
+_CACHED_NAMES = (
+    "is_rainbow", "is_monotone", "has_pair", "has_double", "has_trip", "has_straight", "has_flush",
+    "has_full_house", "has_quad", "has_straight_flush", "has_straightdraw", "has_gutshot",
+    "has_flushdraw", "suit_count", "best_ranking", "cards", "turn", "river",
+)
+
+# keyed by the first Suit value, so the lookup doesn't call the Python level Enum __hash__
+_SUIT_INDEX = {suit.val: index for index, suit in enumerate(Suit)}
+
+# Straight masks use bit N for a rank with numerical value N, so Ace is both bit 14 and bit 1.
+STRAIGHT_MASKS = tuple(0x1F << low for low in range(1, 11))
+_STRAIGHTS = frozenset(STRAIGHT_MASKS)
+# every 4 consecutive ranks, the last one is Jack to Ace
+_FOUR_RANK_MASKS = tuple(0xF << low for low in range(1, 12))
+
+
+def _popcount(mask):
+    return bin(mask).count("1")
+
+
+def _is_straight(straight_mask):
+    """Tell if a straight mask with exactly 5 different ranks is a straight."""
+    # it is a straight when the mask is a straight without one of the Ace bits:
+    # the low one for broadway, the high one for the wheel (no-op without Ace)
+    return (straight_mask & ~0x2) in _STRAIGHTS or (straight_mask & ~0x4000) in _STRAIGHTS
+
+
+# straight mask bits of every rank index, Ace sets both of its bits
+_STRAIGHT_BITS = tuple(1 << (rank_index + 2) for rank_index in range(12)) + (1 << 14 | 1 << 1,)
+
+
+def _to_straight_mask(rank_mask):
+    """Convert a 13 bit rank mask (bit 0 is deuce) to a straight mask."""
+    return (rank_mask << 2) | ((rank_mask >> 12) & 1) << 1
+
+
+# one prime per rank (index 0 is deuce), the product of them tells the ranks and their counts
+_RANK_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+
+def _build_rank_tables():
+    """
+    Map every possible 3-5 card rank distribution to its best ranking (index of RANKING_NAMES).
+    Keys are the products of the rank primes. The second table is for flushes, the third has the
+    two biggest rank counts.
+    """
+    table, flush_table, top_counts = {}, {}, {}
+    for num_cards in (3, 4, 5):
+        for ranks in itertools.combinations_with_replacement(range(13), num_cards):
+            rank_counts = bytearray(13)
+            for rank in ranks:
+                rank_counts[rank] += 1
+            counts = sorted(rank_counts)
+            first, second = counts[12], counts[11]
+            if first > 4:
+                continue
+            rank_product = math.prod(_RANK_PRIMES[rank] for rank in ranks)
+            is_straight = False
+            if num_cards == 5 and first == 1:
+                straight_mask = _to_straight_mask(sum(1 << rank for rank in ranks))
+                is_straight = any(straight_mask & straight == straight for straight in STRAIGHT_MASKS)
+
+            if first == 4:
+                ranking = 7
+            elif first == 3 and second == 2:
+                ranking = 6
+            elif is_straight:
+                ranking = 4
+            elif first == 3:
+                ranking = 3
+            elif first == 2 and second == 2:
+                ranking = 2
+            elif first == 2:
+                ranking = 1
+            else:
+                ranking = 0
+            table[rank_product] = ranking
+            top_counts[rank_product] = first, second
+
+            # only 5 different ranks can be suited
+            if num_cards == 5 and first == 1:
+                flush_table[rank_product] = 8 if is_straight else 5
+    return table, flush_table, top_counts
+
+
+_RANK_TABLE, _FLUSH_RANK_TABLE, _TOP_RANK_COUNTS = _build_rank_tables()
+
+
+@functools.lru_cache(maxsize=4096)
+def _straight_hits(straight_mask):
+    """The most ranks of the straight mask in any 4 and in any 5 consecutive ranks."""
+    return (
+        max(_popcount(straight_mask & mask) for mask in _FOUR_RANK_MASKS),
+        max(_popcount(straight_mask & straight) for straight in STRAIGHT_MASKS),
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _possible_straights(straight_mask, num_cards):
+    """Ranks needed to complete a straight with num_cards more cards, for every straight window."""
+    result = []
+    seen = set()
+    for straight in STRAIGHT_MASKS:
+        if _popcount(straight_mask & straight) != 5 - num_cards:
+            continue
+        # the ranks needed to complete the straight
+        missing = straight & ~straight_mask
+        if missing not in seen:
+            seen.add(missing)
+            result.append(tuple(Rank(value) for value in range(1, 15) if missing >> value & 1))
+    return tuple(result)
+
+
+# Cards as integers: rank index * 4 + suit index (both in definition order, so deuce is rank 0),
+# which sort the same way as Card instances.
+_CODE_CARDS = tuple(Card(rank.val + suit._value_[1]) for rank in Rank for suit in Suit)
+_CODE_STRS = tuple(str(card) for card in _CODE_CARDS)
+_CODE_VALUES = tuple(card.value for card in _CODE_CARDS)
+# every letter case of the two character card strings
+_CARD_CODES = {
+    rank + suit: code
+    for code, value in enumerate(_CODE_VALUES)
+    for rank in (value[0], value[0].lower())
+    for suit in (value[1], value[1].upper())
+}
+
+
+def _card_code(card):
+    """Integer code of a two character card."""
+    try:
+        return _CARD_CODES[card]
+    except KeyError:
+        # Card raises the error for invalid cards or parses the other suit symbols
+        card = Card(card)
+        return (card.rank._value_[1] - 2) * 4 + _SUIT_INDEX[card.suit._value_[0]]
+
+
+def _parse_flop(board):
+    """Parse the first three card codes, sorted in descending order."""
+    first, second, third = _card_code(board[0:2]), _card_code(board[2:4]), _card_code(board[4:6])
+    if first < second:
+        first, second = second, first
+    if second < third:
+        second, third = third, second
+        if first < second:
+            first, second = second, first
+    return [first, second, third]
+
+
+def _parse_turn(board):
+    codes = _parse_flop(board)
+    codes.append(_card_code(board[6:8]))
+    return codes
+
+
+def _parse_river(board):
+    codes = _parse_flop(board)
+    codes.append(_card_code(board[6:8]))
+    codes.append(_card_code(board[8:10]))
+    return codes
+
+
+# board string length -> parser returning the list of card codes
+_PARSERS = {6: _parse_flop, 8: _parse_turn, 10: _parse_river}
+
+
+@functools.lru_cache(maxsize=None)
+def _pack_tables():
+    """numpy tables from the ASCII code of a rank or suit letter to its index, 0xFF if invalid."""
+    import numpy as np
+
+    rank_table = np.full(256, 0xFF, dtype=np.uint8)
+    suit_table = np.full(256, 0xFF, dtype=np.uint8)
+    for card, code in _CARD_CODES.items():
+        rank_table[ord(card[0])] = code >> 2
+        suit_table[ord(card[1])] = code & 3
+    return rank_table, suit_table
+
+
+# frozen boards by canonical board string, see Board.freeze
+_POOL = weakref.WeakValueDictionary()
+
+
+def _canonical(board):
+    """Same string for the same board, regardless of flop order and letter case."""
+    board = board.upper()
+    return "".join(sorted((board[0:2], board[2:4], board[4:6]))) + board[6:]
+
 
 class Board(_ReprMixin):
     """
     A board is a set of cards.
     """
 
+    # __dict__ is only used by the cached properties, __weakref__ by Board.freeze
+    __slots__ = (
+        "_codes", "_str", "_value", "_frozen", "_card_mask", "_suit_masks", "_rank_mask",
+        "_suit_counts", "_rank_product", "_max_suit_count", "_max_rank_count",
+        "_second_rank_count", "_straight_mask",
+        "__dict__", "__weakref__",
+    )
+
     def __new__(cls, board):
         if isinstance(board, Board):
             return board
 
-        if len(board) != 6 and len(board) != 8 and len(board) != 10:
+        parse = _PARSERS.get(len(board))
+        if parse is None:
             raise ValueError("%r, should have a length of 6-8-10" % board)
 
         self = super().__new__(cls)
-
-        turn_card = Card(board[6:8]) if len(board) >= 8 else None
-        river_card = Card(board[8:]) if len(board) == 10 else None
-        self._set_cards(board[:2], board[2:4], board[4:6], turn_card, river_card)
+        self._frozen = False
+        self._codes = parse(board)
         self._create_all_combinations()
 
         return self
@@ -37,204 +237,281 @@ class Board(_ReprMixin):
         """
         Create a board from a list of cards.
         """
-        board = ""
-        for card in cards:
-            board += card.rank.val + card.suit.val
-        return Board(board)
+        return Board("".join(card.rank.val + card.suit.val for card in cards))
 
-    def __str__(self):
-        result = ''
-        for card in self.cards:
-            result += str(card)
+    @classmethod
+    def freeze(cls, board):
+        """
+        Return a shared, immutable board. While a frozen board is referenced, freezing the same
+        board again returns the same instance without parsing it again. Cards can't be added to
+        frozen boards.
+        """
+        if isinstance(board, Board):
+            board = board.value
+        key = _canonical(board)
+        self = _POOL.get(key)
+        if self is None:
+            self = cls(board)
+            self._frozen = True
+            _POOL[key] = self
+        return self
 
-        return result
+    @staticmethod
+    def pack(boards):
+        """
+        Pack boards into a numpy uint64 array for :meth:`classify_batch`.
+        Every item has the 13 bit rank mask of the 4 suits (clubs, diamonds, hearts, spades)
+        from bit 0 upwards. Requires numpy.
+        """
+        import numpy as np
+
+        boards = [board.value if isinstance(board, Board) else board for board in boards]
+        packed = None
+        if all(len(board) in _PARSERS for board in boards):
+            packed = Board._pack_strings(boards)
+        if packed is None:
+            # Board raises the appropriate error or parses the other suit symbols
+            packed = np.fromiter(
+                (sum(mask << (13 * index) for index, mask in enumerate(Board(board)._suit_masks))
+                 for board in boards),
+                dtype=np.uint64,
+            )
+        return packed
+
+    @staticmethod
+    def _pack_strings(boards):
+        """
+        Pack board strings with numpy table lookups, without making Board instances.
+        Returns None if a board is not ASCII, has an invalid or repeated card.
+        """
+        import numpy as np
+
+        try:
+            data = "".join(board.ljust(10) for board in boards).encode("ascii")
+        except UnicodeEncodeError:
+            return None
+        rank_table, suit_table = _pack_tables()
+        # chars[board, card, rank or suit letter]
+        chars = np.frombuffer(data, dtype=np.uint8).reshape(-1, 5, 2)
+        ranks, suits = rank_table[chars[:, :, 0]], suit_table[chars[:, :, 1]]
+        num_cards = np.fromiter((len(board) // 2 for board in boards), dtype=np.uint8)
+        present = np.arange(5) < num_cards[:, None]
+        if ((ranks == 0xFF) | (suits == 0xFF))[present].any():
+            return None
+
+        bit_indexes = np.where(present, suits.astype(np.uint64) * 13 + ranks, 0)
+        bits = np.where(present, np.uint64(1) << bit_indexes, np.uint64(0))
+        packed = np.bitwise_or.reduce(bits, axis=1)
+        # repeated cards set the same bit
+        if (bits.sum(axis=1, dtype=np.uint64) != packed).any():
+            return None
+        return packed
+
+    @staticmethod
+    def classify_batch(packed_boards):
+        """
+        Return the best ranking of every packed board (see :meth:`pack`) as a numpy uint8 array.
+        This is the fast path for evaluating lots of boards at once. Requires numpy.
+        """
+        import numpy as np
+
+        packed_boards = np.asarray(packed_boards, dtype=np.uint64)
+        suit_masks = (packed_boards[:, None] >> (np.arange(4, dtype=np.uint64) * 13)) & 0x1FFF
+        # bits[board, suit, rank]
+        bits = (suit_masks[:, :, None] >> np.arange(13, dtype=np.uint64)) & 1
+        rank_counts = np.sort(bits.sum(axis=1), axis=1)
+        first, second = rank_counts[:, -1], rank_counts[:, -2]
+        is_flush = bits.sum(axis=2).max(axis=1) == 5
+
+        rank_mask = np.bitwise_or.reduce(suit_masks, axis=1)
+        straight_mask = (rank_mask << 2) | ((rank_mask >> 12) & 1) << 1
+        straights = np.array(STRAIGHT_MASKS, dtype=np.uint64)
+        is_straight = ((straight_mask[:, None] & straights) == straights).any(axis=1)
+
+        return np.select(
+            [
+                is_flush & is_straight,
+                first == 4,
+                (first == 3) & (second == 2),
+                is_flush,
+                is_straight,
+                first == 3,
+                (first == 2) & (second == 2),
+                first == 2,
+            ],
+            [8, 7, 6, 5, 4, 3, 2, 1],
+            default=0,
+        ).astype(np.uint8)
 
-    def __hash__(self):
-        result = 0
-        for card in self.cards:
-            result += hash(card)
+    def __str__(self):
+        return self._str
 
-        return result
+    def __hash__(self):
+        return self._card_mask
 
     def __eq__(self, other):
         if self.__class__ is other.__class__:
-            return self.cards == other.cards
+            # the card masks are only a quick check, turn and river order matters too
+            return self._card_mask == other._card_mask and self._codes == other._codes
         return NotImplemented
 
     def __len__(self):
-        return len(self.cards)
-
-    def _set_cards(self, first, second, third, turn, river):
-        self._cards = sorted([Card(first), Card(second), Card(third)], reverse=True)
-        if turn:
-            self._cards.append(Card(turn))
-        if river:
-            self._cards.append(Card(river))
+        return len(self._codes)
 
     def add_cards(self, cards):
-        if len(cards) == 2:
-            cards = [Card(cards)]
-        elif len(cards) == 4:
-            cards = [Card(cards[:2]), Card(cards[2:])]
-        else:
+        if self._frozen:
+            raise ValueError(f"{self!r} is frozen, can't add cards")
+
+        if len(cards) not in (2, 4):
             raise ValueError("%r, should have a length of 2 or 4" % cards)
+        # checked before parsing, so too many cards are rejected right away
+        if len(self._codes) + len(cards) // 2 > 5:
+            raise ValueError("Board is already full")
 
         if len(cards) == 2:
-            if cards[0] == cards[1]:
+            codes = [_card_code(cards)]
+        else:
+            codes = [_card_code(cards[:2]), _card_code(cards[2:])]
+            if codes[0] == codes[1]:
+                cards = [_CODE_CARDS[code] for code in codes]
                 raise ValueError(f"{cards}, Pair can't have the same suit: {cards[0].suit!r}")
 
-        if len(self.cards) + len(cards) > 5:
-            raise ValueError("Board is already full")
-        for card in cards:
-            if card in self.cards:
-                raise ValueError(f"{card!r}, already in board {self.cards}")
+        for code in codes:
+            if self._card_mask >> code & 1:
+                raise ValueError(f"{_CODE_CARDS[code]!r}, already in board {self.cards}")
 
-        self._cards.extend(cards)
+        self._codes.extend(codes)
         self._create_all_combinations()  # create new combinations
+        self._invalidate()
+
+    def _invalidate(self):
+        """Forget the cached properties computed for the previous cards."""
+        for name in _CACHED_NAMES:
+            self.__dict__.pop(name, None)
 
     def _create_all_combinations(self):
         """
-        Create all combinations of cards and counter all ranks to check for straights, flushdraws, etc.
+        Check for repeated cards and build the rank and suit bitmasks to check for straights,
+        flushdraws, etc.
         """
-        self._all_combinations = tuple(itertools.combinations(self.cards, 2))
-        for comb in self._all_combinations:
-            if comb[0] == comb[1]:
-                raise ValueError(f"{comb}, Pair can't have the same suit: {comb[0].suit!r}")
-
-        self._suits = collections.Counter(card.suit for card in self.cards)
-        self._all_ranks_counter = collections.Counter(card.rank for card in self.cards)
-        self._straight_ranks = self._get_straight_ranks()
+        codes = self._codes
+        self._str = "".join(_CODE_STRS[code] for code in codes)
+        self._value = "".join(_CODE_VALUES[code] for code in codes)
+
+        # a 52 bit mask of the card codes, one 13 bit rank mask per suit (bit 0 is deuce,
+        # bit 12 is ace), the count of every suit, the product of the rank primes and the
+        # straight mask
+        card_mask = 0
+        suit_masks = [0, 0, 0, 0]
+        suit_counts = bytearray(4)
+        rank_product = 1
+        straight_mask = 0
+        for code in codes:
+            if card_mask >> code & 1:
+                raise ValueError(f"{_CODE_CARDS[code]!r}, repeated card in board")
+            card_mask |= 1 << code
+            rank_index, suit_index = code >> 2, code & 3
+            suit_masks[suit_index] |= 1 << rank_index
+            suit_counts[suit_index] += 1
+            rank_product *= _RANK_PRIMES[rank_index]
+            straight_mask |= _STRAIGHT_BITS[rank_index]
+        self._card_mask = card_mask
+        self._suit_masks = tuple(suit_masks)
+        self._rank_mask = suit_masks[0] | suit_masks[1] | suit_masks[2] | suit_masks[3]
+        self._rank_product = rank_product
+        self._suit_counts = suit_counts
+        self._max_suit_count = max(suit_counts)
+        self._max_rank_count, self._second_rank_count = _TOP_RANK_COUNTS[rank_product]
+        self._straight_mask = straight_mask
 
     def _get_straight_ranks(self) -> list:
         """return all unique rank cards as integers (Ace is 14 and 1)"""
-        result = set(card.rank.value[1] for card in self.cards)
-        # if As (14) in result append rank 1
-        if 14 in result:
-            result.add(1)
-        return sorted(result)
+        return [value for value in range(1, 15) if self._straight_mask >> value & 1]
 
     def get_possible_straights(self, num_cards=2) -> list:
         """
         num_cards: number of cards to complete a straight
         return: list of possible straights
         """
-        result = []
-        for i in range(len(self._straight_ranks)):
-            # select number i + (5 - num_cards) items if exists
-            n = (5 - num_cards)
-            if i + n <= len(self._straight_ranks):
-                # select n items from numbers
-                ranks_split = self._straight_ranks[i:i + n]
-                # create a range of numbers from the first to the last of the consecutive numbers
-                range_of_numbers = range(max(1, ranks_split[0] - num_cards), min(ranks_split[-1] + num_cards + 1, 15))
-                for j in range(len(range_of_numbers)):
-                    if j + 5 <= len(range_of_numbers):
-                        # select 5 items from range_of_numbers
-                        range_of_numbers_5 = range_of_numbers[j:j + 5]
-                        # check if the consecutive numbers are in the range of numbers
-                        if all([x in range_of_numbers_5 for x in ranks_split]):
-                            # append the ranks needed to complete the straight
-                            str_ranks = [Rank(x) for x in range_of_numbers_5 if x not in ranks_split]
-                            if str_ranks not in result:
-                                result.append(str_ranks)
-
-        return result
+        return [list(ranks) for ranks in _possible_straights(self._straight_mask, num_cards)]
 
-    @property
+    @cached_property
     def is_rainbow(self):
-        return all(
-            first.suit != second.suit for first, second in self._all_combinations
-        )
+        return self._max_suit_count == 1
 
-    @property
+    @cached_property
     def is_monotone(self):
-        return all(
-            first.suit == second.suit for first, second in self._all_combinations
-        )
+        return self._max_suit_count == len(self._codes)
 
     @property
     def get_higher_ranks(self):
-        return sorted(self._all_ranks_counter.keys(), reverse=True)
+        ranks = list(Rank)
+        return [ranks[index] for index in range(12, -1, -1) if self._rank_mask >> index & 1]
 
-    @property
+    @cached_property
     def has_pair(self):
-        return self._all_ranks_counter.most_common(1)[0][1] >= 2
+        return self._max_rank_count >= 2
 
-    @property
+    @cached_property
     def has_double(self):
-        if len(self._all_ranks_counter) < 2:
-            return False
-        result = self._all_ranks_counter.most_common(2)
-        return result[0][1] >= 2 and result[1][1] >= 2
+        return self._max_rank_count >= 2 and self._second_rank_count >= 2
 
-    @property
+    @cached_property
     def has_trip(self):
-        return self._all_ranks_counter.most_common(1)[0][1] >= 3
+        return self._max_rank_count >= 3
 
-    @property
+    @cached_property
     def has_straight(self):
-        ranks_diff = self._get_differences()
-        return ranks_diff.count(1) == 4
+        # a straight needs 5 different ranks
+        if self._max_rank_count != 1 or len(self._codes) < 5:
+            return False
+        return _is_straight(self._straight_mask)
 
-    @property
+    @cached_property
     def has_flush(self):
-        return self.suit_count == 5
+        return self._max_suit_count == 5
 
-    @property
+    @cached_property
     def has_full_house(self):
-        if len(self._all_ranks_counter) < 2:
-            return False
-        result = self._all_ranks_counter.most_common(2)
-        return result[0][1] == 3 and result[1][1] == 2
+        return self._max_rank_count == 3 and self._second_rank_count == 2
 
-    @property
+    @cached_property
     def has_quad(self):
-        return self._all_ranks_counter.most_common(1)[0][1] == 4
+        return self._max_rank_count == 4
 
-    @property
+    @cached_property
     def has_straight_flush(self):
-        return self.has_straight and self.has_flush
+        if self._max_suit_count != 5:
+            return False
+        # the ranks of the flush suit are 5 different ones
+        flush_mask = self._suit_masks[self._suit_counts.index(5)]
+        return _is_straight(_to_straight_mask(flush_mask))
 
-    @property
+    @cached_property
     def has_straightdraw(self):
-        return any(1 <= diff <= 3 for diff in self._get_differences())
+        """Two different ranks are at most 3 apart."""
+        return _straight_hits(self._straight_mask)[0] >= 2
 
-    @property
+    @cached_property
     def has_gutshot(self):
-        return any(1 <= diff <= 4 for diff in self._get_differences())
+        """Two different ranks are at most 4 apart."""
+        return _straight_hits(self._straight_mask)[1] >= 2
 
-    @property
+    @cached_property
     def has_flushdraw(self):
-        return any(
-            first.suit == second.suit for first, second in self._all_combinations
-        )
+        return self._max_suit_count >= 2
 
-    @property
+    @cached_property
     def suit_count(self) -> int:
-        return self._suits.most_common(1)[0][1]
+        return self._max_suit_count
 
-    @property
+    @cached_property
     def best_ranking(self) -> int:
         """
         return the best ranking of the board (8 to 0)
         """
-        if self.has_straight_flush:
-            return 8
-        if self.has_quad:
-            return 7
-        if self.has_full_house:
-            return 6
-        if self.has_flush:
-            return 5
-        if self.has_straight:
-            return 4
-        if self.has_trip:
-            return 3
-        if self.has_double:
-            return 2
-        if self.has_pair:
-            return 1
-        return 0
+        table = _FLUSH_RANK_TABLE if self._max_suit_count == 5 else _RANK_TABLE
+        return table[self._rank_product]
 
     def best_ranking_name(self) -> str:
         """
@@ -242,44 +519,34 @@ class Board(_ReprMixin):
         """
         return RANKING_NAMES[self.best_ranking]
 
-    @property
+    @cached_property
     def flop(self):
-        return tuple(self.cards[:3])
+        return self.cards[:3]
 
-    @property
+    @cached_property
     def turn(self):
-        if len(self.cards) >= 4:
-            return self.cards[3]
+        if len(self._codes) >= 4:
+            return _CODE_CARDS[self._codes[3]]
 
-    @property
+    @cached_property
     def river(self):
-        if len(self.cards) == 5:
-            return self.cards[4]
+        if len(self._codes) == 5:
+            return _CODE_CARDS[self._codes[4]]
 
-    @property
+    @cached_property
     def cards(self):
-        return tuple(self._cards)
-
-    def _get_differences(self):
-        """get differences between a sorted list numbers in self._straight_ranks"""
-        return [y - x for x, y in zip(self._straight_ranks, self._straight_ranks[1:])]
+        # only the card codes are kept, the Card instances are looked up when needed
+        return tuple(_CODE_CARDS[code] for code in self._codes)
 
     @property
     def value(self):
-        result = ''
-        for card in self.cards:
-            result += card.value
-
-        return result
+        return self._value
 
     def suit_counts(self):
         """
         Returns a dictionary counting the number of cards of each suit on the board.
         """
-        suit_counts = {suit: 0 for suit in Suit}
-        for card in self.cards:
-            suit_counts[card.suit] += 1
-        return suit_counts
+        return dict(zip(Suit, self._suit_counts))
 
     def ranks_for_suit(self, suit):
         """
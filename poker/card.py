@@ -36,9 +36,12 @@ class Rank(PokerEnum):
         """Tells the numerical difference between two ranks."""
 
         # so we always get a Rank instance even if string were passed in
-        first, second = cls(first), cls(second)
-        rank_list = list(cls)
-        return abs(rank_list.index(first) - rank_list.index(second))
+        if not isinstance(first, cls):
+            first = cls(first)
+        if not isinstance(second, cls):
+            second = cls(second)
+        # numerical values are consecutive in definition order
+        return abs(first._value_[1] - second._value_[1])
 
 
 FACE_RANKS = Rank("J"), Rank("Q"), Rank("K")
@@ -50,6 +53,8 @@ class _CardMeta(type):
     def __new__(metacls, clsname, bases, classdict):
         """Cache all possible Card instances on the class itself."""
         cls = super(_CardMeta, metacls).__new__(metacls, clsname, bases, classdict)
+        # card strings to the one instance of that card, filled by Card.__new__
+        cls._interned = {}
         cls._all_cards = list(
             cls(f"{rank}{suit}") for rank, suit in itertools.product(Rank, Suit)
         )
@@ -70,24 +75,35 @@ class _CardMeta(type):
 class Card(_ReprMixin, metaclass=_CardMeta):
     """Represents a Card, which consists a Rank and a Suit."""
 
-    __slots__ = ("rank", "suit")
+    __slots__ = ("rank", "suit", "__weakref__")
 
     def __new__(cls, card):
         if isinstance(card, cls):
             return card
 
+        try:
+            return cls._interned[card]
+        except (KeyError, TypeError):
+            pass
+
         if len(card) != 2:
             raise ValueError("length should be two in %r" % card)
 
         self = object.__new__(cls)
         self.rank = Rank(card[0])
         self.suit = Suit(card[1])
+        if isinstance(card, str):
+            # every spelling of the same card shares the instance
+            canonical = f"{self.rank.val}{self.suit.value[1]}"
+            self = cls._interned[card] = cls._interned.setdefault(canonical, self)
         return self
 
     def __hash__(self):
         return hash(self.rank) + hash(self.suit)
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if self.__class__ is other.__class__:
             return self.rank == other.rank and self.suit == other.suit
         return NotImplemented
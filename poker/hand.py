@@ -83,7 +83,7 @@ class _HandMeta(type):
 class Hand(_ReprMixin, metaclass=_HandMeta):
     """General hand without a precise suit. Only knows about two ranks and shape."""
 
-    __slots__ = ("first", "second", "_shape")
+    __slots__ = ("first", "second", "_shape", "__weakref__")
 
     def __new__(cls, hand):
         if isinstance(hand, cls):
@@ -238,7 +238,7 @@ SUITED_HANDS = tuple(hand for hand in Hand if hand.is_suited)
 class Combo(_ReprMixin):
     """Hand combination."""
 
-    __slots__ = ("first", "second")
+    __slots__ = ("first", "second", "_shape", "__weakref__")
 
     def __new__(cls, combo):
         if isinstance(combo, Combo):
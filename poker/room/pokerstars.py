@@ -1,3 +1,5 @@
+import bisect
+import functools
 import re
 import typing as t
 from datetime import datetime
@@ -14,55 +16,63 @@ from ..card import Card
 from ..constants import Limit, Game, GameType, Currency, Action, MoneyType
 from ..hand import Combo
 
-__all__ = ["PokerStarsHandHistory", "Notes"]
+__all__ = ["PokerStarsHandHistory", "Notes", "ReadOnlyNotes"]
+
+
+@functools.lru_cache(maxsize=512)
+def _dec(amount):
+    """Decimal of an amount string. Stakes repeat a lot, so the parsed values are cached."""
+    return Decimal(amount)
 
 
 @implementer(hh.IStreet)
 class _Street(hh._BaseStreet):
-    _collected_re = re.compile(r"(.+) collected (?:\$|£|€)?(\d+(\.\d+)?) from pot")
+    _collected_re = re.compile(r"(.+) collected [$£€]?(\d+(\.\d+)?) from pot")
+    _uncalled_bet_re = re.compile(r"^Uncalled bet \([$£€]?(?P<amount>\d+(?:\.\d+)?)\) returned to (?P<name>.+)")
+    # name until the first ": ", the action word and the next word as the amount without currency
+    _player_action_re = re.compile(r"\s*(?P<name>.*?)\s*: \s*(?P<action>\S*)\s*[$£€]*(?P<amount>\S*)")
+    # alternatives are tried in order from the start of the line,
+    # so they have the same priority as the checks they replace
+    _action_line_re = re.compile(
+        r"(?P<uncalled>Uncalled bet)"
+        r"|(?P<collected>(?=.*collected))"
+        r"|(?P<muck>(?=.*doesn't show hand))"
+        r'|(?P<chat>(?=.* said, "))'
+        r"|(?P<player>(?=.*: ))"
+        r"|(?P<noise>(?=.*(?:joins|leaves|connected|timed out|failing to post)))"
+    )
 
-    def _parse_cards(self, boardline):
-        self.cards = (Card(boardline[1:3]), Card(boardline[4:6]), Card(boardline[7:9]))
+    def _parse_cards(self, boardline, _Card=Card):
+        self.cards = (_Card(boardline[1:3]), _Card(boardline[4:6]), _Card(boardline[7:9]))
 
     def _parse_actions(self, actionlines):
         actions = []
+        match_line = self._action_line_re.match
+        parsers = self._action_parsers
         for line in actionlines:
-
-            action = None
-
-            if line.startswith("Uncalled bet"):
-                action = self._parse_uncalled(line)
-            elif "collected" in line:
-                action = self._parse_collected(line)
-            elif "doesn't show hand" in line:
-                action = self._parse_muck(line)
-            elif ' said, "' in line:  # skip chat lines
-                continue
-            elif ": " in line:
-                action = self._parse_player_action(line)
-            elif "joins" in line or "leaves" in line or "connected" in line or "timed out" in line or "failing to post" in line:
-                pass
-            else:
+            match = match_line(line)
+            if match is None:
                 raise RuntimeError("bad action line: " + line)
 
+            # chat and table noise lines have no parser
+            parser_name = parsers.get(match.lastgroup)
+            action = getattr(self, parser_name)(line) if parser_name else None
+
             if action:
                 actions.append(hh._PlayerAction(*action))
 
         self.actions = tuple(actions) if actions else None
 
     def _parse_uncalled(self, line):
-        first_paren_index = line.find("(")
-        second_paren_index = line.find(")")
-        amount = line[first_paren_index + 1: second_paren_index]
-        name_start_index = line.find("to ") + 3
-        name = line[name_start_index:]
-        return name, Action.RETURN, Decimal(amount.strip("$£€"))
+        match = self._uncalled_bet_re.match(line)
+        name, amount = match.group("name", "amount")
+        return name, Action.RETURN, _dec(amount)
 
     def _parse_collected(self, line):
         match = self._collected_re.match(line)
         name = match.group(1)
         amount = match.group(2)
-        self.pot = Decimal(amount.strip("$£€"))
+        self.pot = _dec(amount)
 
         return name, Action.WIN, self.pot
 
@@ -72,25 +82,30 @@ class _Street(hh._BaseStreet):
         return name, Action.MUCK, None
 
     def _parse_player_action(self, line):
-        name, _, action = map(str.strip, line.partition(": "))
-        action, _, amount = map(str.strip, action.partition(" "))
-        amount, _, _ = map(str.strip, amount.partition(" "))
+        match = self._player_action_re.match(line)
+        name, action, amount = match.group("name", "action", "amount")
 
         # Needed for lines where player folds and shows hand
         if "folds" in line:
             amount = None
-        else:
-            amount = amount.strip("$£€")
 
         # No action when player simply shows hand
         if action == "shows":
             return None
 
         if amount:
-            return name, Action(action), Decimal(amount)
+            return name, Action(action), _dec(amount)
         else:
             return name, Action(action), None
 
+    # method names, so subclasses can override the parsers
+    _action_parsers = {
+        "uncalled": "_parse_uncalled",
+        "collected": "_parse_collected",
+        "muck": "_parse_muck",
+        "player": "_parse_player_action",
+    }
+
 
 @implementer(hh.IHandHistory)
 class PokerStarsHandHistory(hh._SplittableHandHistoryMixin, hh._BaseHandHistory):
@@ -105,8 +120,8 @@ class PokerStarsHandHistory(hh._SplittableHandHistoryMixin, hh._BaseHandHistory)
                         Hand\s+\#(?P<ident>\d+):\s+                   # Hand history id
                         (Tournament\s+\#(?P<tournament_ident>\d+),\s+ # Tournament Number
                          ((?P<freeroll>Freeroll)|(                    # buyin is Freeroll
-                          (?:\$|£|€)?(?P<buyin>\d+(\.\d+)?)                   # or buyin
-                          (\+(?:\$|£|€)?(?P<rake>\d+(\.\d+)?))?               # and rake
+                          [$£€]?(?P<buyin>\d+(\.\d+)?)                # or buyin
+                          (\+[$£€]?(?P<rake>\d+(\.\d+)?))?            # and rake
                           (\s+(?P<currency>[A-Z]+))?                  # and currency
                          ))\s+
                         )?
@@ -115,8 +130,8 @@ class PokerStarsHandHistory(hh._SplittableHandHistoryMixin, hh._BaseHandHistory)
                         (-\s+Level\s+(?P<tournament_level>\S+)\s+)?   # Level (optional)
                         \(
                          (((?P<sb>\d+)/(?P<bb>\d+))|(                 # tournament blinds
-                          (?:\$|£|€)(?P<cash_sb>\d+(\.\d+)?)/                 # cash small blind
-                          (?:\$|£|€)(?P<cash_bb>\d+(\.\d+)?)                  # cash big blind
+                          [$£€](?P<cash_sb>\d+(\.\d+)?)/              # cash small blind
+                          [$£€](?P<cash_bb>\d+(\.\d+)?)               # cash big blind
                           (\s+(?P<cash_currency>\S+))?                # cash currency
                          ))
                         \)\s+
@@ -129,21 +144,29 @@ class PokerStarsHandHistory(hh._SplittableHandHistoryMixin, hh._BaseHandHistory)
         r"^Table '(.*)' (\d+)-max Seat #(?P<button>\d+) is the button"
     )
     _seat_re = re.compile(
-        r"^Seat (?P<seat>\d+): (?P<name>.+?) \((?:\$|£|€)?(?P<stack>\d+(\.\d+)?) in chips\)"
+        r"^Seat (?P<seat>\d+): (?P<name>.+?) \([$£€]?(?P<stack>\d+(\.\d+)?) in chips\)",
+        re.MULTILINE,
     )  # noqa
-    _blind_re = re.compile(
-        r"^(?P<name>.+?): posts (?P<blind>small|big|small & big) blind(?:s)? (?:\$|£|€)?(?P<amount>\d+(\.\d+)?)")
     _hero_re = re.compile(r"^Dealt to (?P<hero_name>.+?) \[(..) (..)\]")
-    _pot_re = re.compile(r"^Total pot (?:\$|£|€)?(\d+(?:\.\d+)?) .*\| Rake (?:\$|£|€)?(\d+(?:\.\d+)?)")
+    _pot_re = re.compile(r"^Total pot [$£€]?(\d+(?:\.\d+)?) .*\| Rake [$£€]?(\d+(?:\.\d+)?)")
     _winner_re = re.compile(
-        r"^Seat (\d+): (.+?) (?:(?:^$|\(button\)|\(small blind\)|\(big blind\))\s){0,2}collected \((?:\$|£|€)?(\d+(?:\.\d+)?)\)")
+        r"^Seat (\d+): (.+?) (?:(?:^$|\(button\)|\(small blind\)|\(big blind\))\s){0,2}collected \([$£€]?(\d+(?:\.\d+)?)\)",
+        re.MULTILINE)
     _showdown_re = re.compile(
-        r"^Seat (\d+): (.+?) (?:(?:^$|\(button\)|\(small blind\)|\(big blind\))\s){0,2}showed \[.+?\] and won \((?:\$|£|€)?(\d+(?:\.\d+)?)\) with \w+?")
+        r"^Seat (\d+): (.+?) (?:(?:^$|\(button\)|\(small blind\)|\(big blind\))\s){0,2}showed \[.+?\] and won \([$£€]?(\d+(?:\.\d+)?)\) with \w+?",
+        re.MULTILINE)
     _ante_re = re.compile(r".*posts the ante (\d+(?:\.\d+)?)")
     _board_re = re.compile(r"(?<=[\[ ])(..)(?=[\] ])")
-    _action_re = re.compile(
-        r"(?P<name>.+?): (?P<action>.+?) (?:\$|£|€)?(?P<amount>\d+(?:\.\d+)?)?( to )?(?:\$|£|€)?(?P<total_amount>\d+(?:\.\d+)?)?")
-    _uncalled_bet_re = re.compile(r"^Uncalled bet \((?:\$|£|€)?(?P<amount>\d+(?:\.\d+)?)\) returned to (?P<name>.+)")
+    # blind, player action or uncalled bet line, tried in this order. lastgroup tells which one matched
+    _result_line_re = re.compile(
+        r"(?P<blind_line>(?P<blind_name>.+?): posts (?P<blind>small|big|small & big) blind(?:s)? "
+        r"[$£€]?(?P<blind_amount>\d+(\.\d+)?))"
+        r"|(?P<action_line>(?P<name>.+?): (?P<action>.+?) [$£€]?(?P<amount>\d+(?:\.\d+)?)?( to )?"
+        r"[$£€]?(?P<total_amount>\d+(?:\.\d+)?)?)"
+        r"|(?P<uncalled_line>Uncalled bet \([$£€]?(?P<uncalled_amount>\d+(?:\.\d+)?)\) returned to "
+        r"(?P<uncalled_name>.+))"
+    )
+    _markers = ("FLOP", "TURN", "RIVER", "SHOW DOWN", "FIRST SHOW DOWN")
 
     def parse_header(self):
         # sections[0] is before HOLE CARDS
@@ -159,8 +182,8 @@ class PokerStarsHandHistory(hh._SplittableHandHistoryMixin, hh._BaseHandHistory)
         # and cash blind captures because a cash game play money blind looks exactly
         # like a tournament blind
 
-        self.sb = Decimal(match.group("sb") or match.group("cash_sb"))
-        self.bb = Decimal(match.group("bb") or match.group("cash_bb"))
+        self.sb = _dec(match.group("sb") or match.group("cash_sb"))
+        self.bb = _dec(match.group("bb") or match.group("cash_bb"))
 
         if match.group("tournament_ident"):
             self.game_type = GameType.TOUR
@@ -168,8 +191,8 @@ class PokerStarsHandHistory(hh._SplittableHandHistoryMixin, hh._BaseHandHistory)
             self.tournament_level = match.group("tournament_level")
 
             currency = match.group("currency")
-            self.buyin = Decimal(match.group("buyin") or 0)
-            self.rake = Decimal(match.group("rake") or 0)
+            self.buyin = _dec(match.group("buyin") or 0)
+            self.rake = _dec(match.group("rake") or 0)
         else:
             self.game_type = GameType.CASH
             self.tournament_ident = None
@@ -200,9 +223,11 @@ class PokerStarsHandHistory(hh._SplittableHandHistoryMixin, hh._BaseHandHistory)
         if not self.header_parsed:
             self.parse_header()
 
+        self._find_markers()
         self._parse_table()
         self._parse_players()
         self._parse_button()
+        self._parse_blinds()
         self._parse_hero()
         self._parse_preflop()
         self._parse_flop()
@@ -215,34 +240,49 @@ class PokerStarsHandHistory(hh._SplittableHandHistoryMixin, hh._BaseHandHistory)
         self._parse_winners()
 
         self._del_split_vars()
+        del self._marker_indexes
         self.parsed = True
 
+    def _find_markers(self):
+        """Find the first index of every street and showdown marker in one pass."""
+        self._marker_indexes = {}
+        for index, line in enumerate(self._splitted):
+            if line in self._markers:
+                self._marker_indexes.setdefault(line, index)
+
+    def _section_end(self, start):
+        """Index of the first empty line (end of the section) from start."""
+        section = bisect.bisect_left(self._sections, start)
+        if section == len(self._sections):
+            raise ValueError(f"No section end after line {start}")
+        return self._sections[section]
+
     def _parse_table(self):
         self._table_match = self._table_re.match(self._splitted[1])
         self.table_name = self._table_match.group(1)
         self.max_players = int(self._table_match.group(2))
 
     def _parse_players(self):
-        self.players = self._init_seats(self.max_players)
-        self._player2index = dict()
-        for line in self._splitted[2:]:
-            match = self._seat_re.match(line)
-            # we reached the end of the players section
-            if not match:
-                break
-            index = int(match.group("seat")) - 1
-            self.players[index] = hh._Player(
-                name=match.group("name"),
-                stack=float(match.group("stack")),
-                seat=int(match.group("seat")),
-                combo=None,
-            )
-            self._player2index[match.group("name")] = index
+        players = self.players = self._init_seats(self.max_players)
+        player2index = self._player2index = dict()
+        # seat lines are the only ones matching before HOLE CARDS, so scan them all at once
+        seat_lines = "\n".join(self._splitted[2:self._sections[0]])
+        for match in self._seat_re.finditer(seat_lines):
+            name, stack, seat = match.group("name", "stack", "seat")
+            seat = int(seat)
+            players[seat - 1] = hh._Player(name, float(stack), seat, None)
+            player2index[name] = seat - 1
 
     def _parse_button(self):
         button_seat = int(self._table_match.group("button"))
         self.button = self.players[button_seat - 1]
 
+    def _parse_blinds(self):
+        # kept for get_results, which runs after the split lines are deleted
+        self._blind_action_lines = tuple(
+            line for line in self._splitted[:self._sections[0]] if " posts " in line
+        )
+
     def _parse_hero(self):
         hole_cards_line = self._splitted[self._sections[0] + 2]
         match = self._hero_re.match(hole_cards_line)
@@ -259,62 +299,53 @@ class PokerStarsHandHistory(hh._SplittableHandHistoryMixin, hh._BaseHandHistory)
 
     def _parse_flop(self):
         try:
-            start = self._splitted.index("FLOP") + 1
-        except ValueError:
+            start = self._marker_indexes["FLOP"] + 1
+        except KeyError:
             self.flop = None
             return
-        stop = self._splitted.index("", start)
+        stop = self._section_end(start)
         floplines = self._splitted[start:stop]
         self.flop = _Street(floplines)
 
     def _parse_street(self, street):
         try:
-            start = self._splitted.index(street.upper()) + 2
-            stop = self._splitted.index("", start)
+            start = self._marker_indexes[street.upper()] + 2
+            stop = self._section_end(start)
             street_actions = self._splitted[start:stop]
             setattr(
                 self,
                 f"{street.lower()}_actions",
                 tuple(street_actions) if street_actions else None,
             )
-        except ValueError:
+        except (KeyError, ValueError):
             setattr(self, street, None)
             setattr(self, f"{street.lower()}_actions", None)
 
     def _parse_showdown(self):
-        self.show_down = "SHOW DOWN" in self._splitted or "FIRST SHOW DOWN" in self._splitted
+        self.show_down = "SHOW DOWN" in self._marker_indexes or "FIRST SHOW DOWN" in self._marker_indexes
 
     def _parse_pot(self):
-        potline = self._splitted[self._sections[-1] + 2]
+        summary = self._sections[-1]
+        potline = self._splitted[summary + 2]
         match = self._pot_re.match(potline)
         self.total_pot = float(match.group(1))
         self.rake = float(match.group(2))
 
     def _parse_board(self):
-        boardline = self._splitted[self._sections[-1] + 3]
+        summary = self._sections[-1]
+        boardline = self._splitted[summary + 3]
         if not boardline.startswith("Board"):
             return
         cards = self._board_re.findall(boardline)
-        self.turn = Card(cards[3]) if len(cards) > 3 else None
-        self.river = Card(cards[4]) if len(cards) > 4 else None
+        num_cards = len(cards)
+        self.turn = Card(cards[3]) if num_cards > 3 else None
+        self.river = Card(cards[4]) if num_cards > 4 else None
 
     def _parse_winners(self):
-        winners = set()
-        start = self._sections[-1] + 3
-        for line in self._splitted[start:]:
-            if not self.show_down and "collected" in line:
-                match = self._winner_re.match(line)
-                winners.add(match.group(2))
-            elif self.show_down and "won" in line:
-                match = self._showdown_re.match(line)
-                if match:
-                    winners.add(match.group(2))
-
-        self.winners = tuple(winners)
-
-    def _get_player_index(self, name: str) -> int:
-        """Returns the index of the player with the given name."""
-        return self._player2index[name]
+        summary = self._sections[-1]
+        summary_lines = "\n".join(self._splitted[summary + 3:])
+        winner_re = self._showdown_re if self.show_down else self._winner_re
+        self.winners = tuple({name for _, name, _ in winner_re.findall(summary_lines)})
 
     def get_results(self, exclude_rake: bool = True) -> t.List[hh._PlayerResult]:
         """
@@ -325,30 +356,28 @@ class PokerStarsHandHistory(hh._SplittableHandHistoryMixin, hh._BaseHandHistory)
         if not self.parsed:
             self.parse()
 
-        # Init results
-        results = [hh._PlayerResult(name=player.name,
-                                    seat=player.seat,
-                                    net=0) for player in self.players]
+        # Net of every player by seat index, street_start is the state before the current street
+        nets = [0] * len(self.players)
         buying_the_button = set()
         small_posted = False
+        player_index = self._player2index
+        result_line_match = self._result_line_re.match
+        sb = float(self.sb)
 
-        # Blinds
-        blind_actions = list()
-        for line in self._splitted[:self._sections[0]]:
-            if " posts " in line:
-                blind_actions.append(line)
-        # Streets
-        for street, street_name in ((blind_actions + list(self.preflop_actions), "preflop"),
+        # Streets, blinds are posted before the preflop actions
+        for street, street_name in ((self._blind_action_lines + self.preflop_actions, "preflop"),
                                     (self.flop_actions or [], "flop"),
                                     (self.turn_actions or [], "turn"),
                                     (self.river_actions or [], "river")):
-            previous_street_state = {player.name: player.net for player in results}
+            street_start = nets[:]
             for action in street:
+                match = result_line_match(action)
+                line_type = match.lastgroup if match else None
 
-                if match := self._blind_re.match(action):
-                    name = match.group("name")
-                    amount = float(match.group("amount"))
-                    results[self._get_player_index(name)].net -= amount
+                if line_type == "blind_line":
+                    name = match.group("blind_name")
+                    amount = float(match.group("blind_amount"))
+                    nets[player_index[name]] -= amount
 
                     # If the player has already posted the SB and BB
                     if match.group("blind") == "small & big":
@@ -362,7 +391,7 @@ class PokerStarsHandHistory(hh._SplittableHandHistoryMixin, hh._BaseHandHistory)
                         elif small_posted:
                             buying_the_button.add(name)
 
-                elif match := self._action_re.match(action):
+                elif line_type == "action_line":
                     name = match.group("name")
                     action = match.group("action")
 
@@ -372,32 +401,32 @@ class PokerStarsHandHistory(hh._SplittableHandHistoryMixin, hh._BaseHandHistory)
                         amount = float(match.group("amount") or 0)
 
                     if action in {"bets", "raises"}:
-                        player = results[self._get_player_index(name)]
-                        player.net = previous_street_state[name] - float(amount)
+                        index = player_index[name]
+                        nets[index] = street_start[index] - amount
 
                         # In case player posted both blinds
-                        if street_name == "preflop" and player.name in buying_the_button:
-                            player.net -= float(self.sb)
+                        if street_name == "preflop" and name in buying_the_button:
+                            nets[index] -= sb
 
                     elif action == "calls":
-                        player = results[self._get_player_index(name)]
-                        player.net -= float(amount)
+                        nets[player_index[name]] -= amount
 
                     elif action in {"folds", "checks", "doesn't", "shows"}:
                         pass
                     else:
                         raise ValueError(f"Unknown action: {action}")
-                elif match := self._uncalled_bet_re.match(action):
-                    name = match.group("name")
-                    amount = float(match.group("amount"))
-                    results[self._get_player_index(name)].net += float(amount)
+                elif line_type == "uncalled_line":
+                    name = match.group("uncalled_name")
+                    amount = float(match.group("uncalled_amount"))
+                    nets[player_index[name]] += amount
 
         # Winnings
         total_pot = self.total_pot - float(self.rake) if exclude_rake else self.total_pot
         for winner in self.winners:
-            results[self._get_player_index(winner)].net += total_pot / len(self.winners)
+            nets[player_index[winner]] += total_pot / len(self.winners)
 
-        return results
+        return [hh._PlayerResult(name=player.name, seat=player.seat, net=net)
+                for player, net in zip(self.players, nets)]
 
 
 @attr.s(slots=True)
@@ -436,6 +465,8 @@ class Notes:
         self.raw = notes
         parser = etree.XMLParser(recover=True, resolve_entities=False)
         self.root = etree.XML(notes.encode(), parser)
+        self._label_texts = None
+        self._note_index = None
 
     def __str__(self):
         return etree.tostring(
@@ -443,10 +474,31 @@ class Notes:
         ).decode()
 
     @classmethod
-    def from_file(cls, filename):
-        """Make an instance from a XML file."""
+    def from_file(cls, filename, streaming=False):
+        """Make an instance from a XML file.
+
+        With ``streaming=True`` the file is parsed incrementally and a :class:`ReadOnlyNotes`
+        is returned with only the labels and notes instead of the whole XML tree, which needs
+        much less memory for big files.
+        """
+        if streaming:
+            return ReadOnlyNotes._from_events(
+                etree.iterparse(str(filename), events=("end",), tag=("label", "note"),
+                                recover=True, resolve_entities=False)
+            )
         return cls(Path(filename).open().read())
 
+    @classmethod
+    def from_string(cls, notes: str, streaming=False):
+        """Make an instance from a XML string.
+
+        With ``streaming=True`` the string is fed to a pull parser in chunks and a
+        :class:`ReadOnlyNotes` is returned, the same way as :meth:`from_file` does it.
+        """
+        if streaming:
+            return ReadOnlyNotes._from_events(ReadOnlyNotes._pull_events(notes.encode()))
+        return cls(notes)
+
     @property
     def players(self):
         """Tuple of player names."""
@@ -491,6 +543,8 @@ class Notes:
         new_note = etree.Element("note", player=player, label=label_id, update=update)
         new_note.text = text
         self.root.append(new_note)
+        if self._note_index is not None:
+            self._note_index.setdefault(player, new_note)
 
     def append_note(self, player, text):
         """Append text to an already existing note."""
@@ -515,27 +569,36 @@ class Notes:
     def del_note(self, player):
         """Delete a note by player name."""
         self.root.remove(self._find_note(player))
+        # another note could exist for the same player
+        self._note_index = None
 
     def _find_note(self, player):
-        # if player name contains a double quote, the search phrase would be invalid.
-        # &quot; entitiy is searched with ", e.g. &quot;bootei&quot; is searched with '"bootei"'
-        quote = "'" if '"' in player else '"'
-        note = self.root.find(f"note[@player={quote}{player}{quote}]")
-        if note is None:
+        if self._note_index is None:
+            self._note_index = {}
+            for note in self.root.iter("note"):
+                # the first note is found for a player, like with a search
+                self._note_index.setdefault(note.get("player"), note)
+        try:
+            return self._note_index[player]
+        except KeyError:
             raise NoteNotFoundError(player)
-        return note
 
     def _get_note_data(self, note):
-        labels = {label.get("id"): label.text for label in self.root.iter("label")}
-        label = note.get("label")
-        label = labels[label] if label != "-1" else None
-        timestamp = note.get("update")
+        if self._label_texts is None:
+            self._label_texts = {label.get("id"): label.text for label in self.root.iter("label")}
+        return self._make_note(
+            self._label_texts, note.get("player"), note.get("label"), note.get("update"), note.text
+        )
+
+    @staticmethod
+    def _make_note(label_texts, player, label, timestamp, text):
+        label = label_texts[label] if label != "-1" else None
         if timestamp:
             timestamp = int(timestamp)
             update = datetime.utcfromtimestamp(timestamp).replace(tzinfo=pytz.UTC)
         else:
             update = None
-        return _Note(note.get("player"), label, update, note.text)
+        return _Note(player, label, update, text)
 
     def get_label(self, name):
         """Find the label by name."""
@@ -556,11 +619,13 @@ class Notes:
         new_label.text = name
 
         labels_tag.append(new_label)
+        self._label_texts = None
 
     def del_label(self, name):
         """Delete a label by name."""
         labels_tag = self.root[0]
         labels_tag.remove(self._find_label(name))
+        self._label_texts = None
 
     def _find_label(self, name):
         labels_tag = self.root[0]
@@ -576,3 +641,88 @@ class Notes:
         """Save the note XML to a file."""
         with open(filename, "w") as fp:
             fp.write(str(self))
+
+
+class ReadOnlyNotes:
+    """
+    Labels and notes of PokerStars XML notes without the XML tree, made by :meth:`Notes.from_file`
+    or :meth:`Notes.from_string` with ``streaming=True``. They can't be modified or saved.
+    """
+
+    def __init__(self, labels, notes):
+        self.labels = tuple(labels)
+        self.notes = tuple(notes)
+        # the first one is found by name, like in Notes
+        self._label_index = {}
+        for label in self.labels:
+            self._label_index.setdefault(label.name, label)
+        self._note_index = {}
+        for note in self.notes:
+            self._note_index.setdefault(note.player, note)
+
+    @staticmethod
+    def _pull_events(data, chunk_size=1 << 16):
+        # PokerStars writes control characters into note texts, so recover like Notes does,
+        # otherwise real notes files fail to parse
+        parser = etree.XMLPullParser(events=("end",), tag=("label", "note"),
+                                     recover=True, resolve_entities=False)
+        for start in range(0, len(data), chunk_size):
+            parser.feed(data[start:start + chunk_size])
+            yield from parser.read_events()
+        parser.close()
+        yield from parser.read_events()
+
+    @classmethod
+    def _from_events(cls, events):
+        """Make an instance from the "end" events of label and note elements."""
+        labels, notes = [], []
+        for _, element in events:
+            if element.tag == "label":
+                labels.append(_Label(element.get("id"), element.get("color"), element.text))
+            else:
+                notes.append((element.get("player"), element.get("label"), element.get("update"),
+                              element.text))
+            # free the processed elements
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+        label_texts = {label.id: label.name for label in labels}
+        return cls(labels, (Notes._make_note(label_texts, *note) for note in notes))
+
+    @property
+    def players(self):
+        """Tuple of player names."""
+        return tuple(note.player for note in self.notes)
+
+    @property
+    def label_names(self):
+        """Tuple of label names."""
+        return tuple(label.name for label in self.labels)
+
+    def get_note_text(self, player):
+        """Return note text for the player."""
+        return self.get_note(player).text
+
+    def get_note(self, player):
+        """Return :class:`_Note` tuple for the player."""
+        try:
+            return self._note_index[player]
+        except KeyError:
+            raise NoteNotFoundError(player)
+
+    def get_label(self, name):
+        """Find the label by name."""
+        try:
+            return self._label_index[name]
+        except KeyError:
+            raise LabelNotFoundError(name)
+
+    def __str__(self):
+        return f"<{self.__class__.__name__}: {len(self.labels)} labels, {len(self.notes)} notes>"
+
+    def _read_only(self, *args, **kwargs):
+        raise ValueError("Notes are read only, use Notes to modify or save them")
+
+    # everything in Notes which modifies or saves the XML
+    add_note = append_note = prepend_note = replace_note = _read_only
+    change_note_label = del_note = add_label = del_label = save = _read_only
@@ -43,6 +43,7 @@ setup(
     license="MIT",
     packages=find_packages(),
     install_requires=install_requires,
+    extras_require={"numpy": ["numpy"]},
     entry_points={"console_scripts": console_scripts},
     tests_require=["pytest", "coverage", "coveralls"],
 )
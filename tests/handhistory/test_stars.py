@@ -48,6 +48,15 @@ def flop():
     )
 
 
+def test_street_action_parsers_can_be_overridden():
+    class MuckStreet(_Street):
+        def _parse_muck(self, line):
+            return "mucked", Action.MUCK, None
+
+    street = MuckStreet(["[2s 6d 6h]", "W2lkm2n: doesn't show hand"])
+    assert street.actions == (_PlayerAction("mucked", Action.MUCK, None),)
+
+
 def test_open_from_file(testdir):
     bbb_path = str(testdir.joinpath("handhistory/bbb.txt"))
     hh = PokerStarsHandHistory.from_file(bbb_path)
@@ -606,6 +615,14 @@ class TestBodyEveryStreet:
     def test_flop_pot(self, hand):
         assert hand.flop.pot == Decimal(800)
 
+    def test_results(self, hand):
+        nets = {result.name: result.net for result in hand.get_results()}
+        assert nets["flettl2"] == 675
+        assert nets["MISTRPerfect"] == -50
+        assert nets["blak_douglas"] == -625
+        # blinds are kept after parsing, so results can be asked for again
+        assert hand.get_results(exclude_rake=False) == hand.get_results()
+
 
 class TestClassRepresentation:
     hand_text = stars_hands.HAND1
@@ -2,7 +2,7 @@ from pathlib import Path
 from datetime import datetime
 from pytz import UTC
 import pytest
-from poker.room.pokerstars import Notes, _Note, _Label, NoteNotFoundError
+from poker.room.pokerstars import Notes, ReadOnlyNotes, _Note, _Label, NoteNotFoundError
 
 
 @pytest.fixture
@@ -159,6 +159,14 @@ def test_delete_note(notes):
     assert "$dollarsign" in notes.players
     notes.del_note("$dollarsign")
     assert "$dollarsign" not in notes.players
+    with pytest.raises(NoteNotFoundError):
+        notes.get_note("$dollarsign")
+
+
+def test_add_note_after_search(notes):
+    assert notes.get_note_text("regplayer") == "river big bet 99"
+    notes.add_note("Walkman", "is a big fish", label="FISH")
+    assert notes.get_note_text("Walkman") == "is a big fish"
 
 
 def test_find_player_with_html_quotes(notes):
@@ -197,6 +205,13 @@ def test_add_label(notes):
     )
 
 
+def test_note_label_after_adding_label(notes):
+    assert notes.get_note("regplayer").label == "FISH"
+    notes.add_label("YETI", "FF0000")
+    notes.change_note_label("regplayer", "YETI")
+    assert notes.get_note("regplayer").label == "YETI"
+
+
 def test_delete_label(notes):
     notes.del_label("REG")
     assert notes.labels == (
@@ -204,3 +219,48 @@ def test_delete_label(notes):
         _Label(id="1", color="30FF97", name="SHARK"),
         _Label(id="3", color="E1FF80", name="GENERAL"),
     )
+
+
+def test_streaming_from_file(notes):
+    filedir = Path(__file__).parent
+    streamed = Notes.from_file(filedir / "notes.W2lkm2n.xml", streaming=True)
+    assert streamed.players == notes.players
+    assert streamed.labels == notes.labels
+    assert streamed.label_names == notes.label_names
+    assert streamed.notes == notes.notes
+    assert streamed.get_note("regplayer") == notes.get_note("regplayer")
+    assert streamed.get_note_text("regplayer") == "river big bet 99"
+    assert streamed.get_label("FISH") == notes.get_label("FISH")
+    with pytest.raises(NoteNotFoundError):
+        streamed.get_note("Nosuchnote")
+
+
+def test_streaming_from_string(notes):
+    streamed = Notes.from_string(notes.raw, streaming=True)
+    assert streamed.players == notes.players
+    assert streamed.labels == notes.labels
+    assert streamed.notes == notes.notes
+    assert streamed.get_note_text("regplayer") == "river big bet 99"
+
+
+def test_streaming_is_read_only(notes):
+    streamed = Notes.from_string(notes.raw, streaming=True)
+    assert isinstance(streamed, ReadOnlyNotes)
+    assert str(streamed) == "<ReadOnlyNotes: 4 labels, 11 notes>"
+    with pytest.raises(ValueError, match="read only"):
+        streamed.add_note("newplayer", "text")
+    with pytest.raises(ValueError, match="read only"):
+        streamed.del_note("regplayer")
+    with pytest.raises(ValueError, match="read only"):
+        streamed.save("notes.xml")
+
+
+def test_streaming_recovers_invalid_characters():
+    xml = (
+        '<?xml version="1.0" encoding="UTF-8"?>\n<notes version="1"><labels>'
+        '<label id="0" color="30DBFF">FISH</label></labels>'
+        '<note player="fishplayer" label="0" update="1435708166">bad \x10 char</note></notes>'
+    )
+    streamed = Notes.from_string(xml, streaming=True)
+    assert streamed.players == Notes(xml).players == ("fishplayer",)
+    assert streamed.get_note("fishplayer").label == "FISH"
@@ -1,3 +1,4 @@
+import random
 import pytest
 from poker.card import Card, Rank
 from poker.board import Board
@@ -115,10 +116,12 @@ def test_compare_boards():
     board1 = Board("AcKcQhJs")
     board2 = Board("QhKcAcJs")
     assert board1 == board2
+    assert hash(board1) == hash(board2)
     board1.add_cards("2c")
     assert board1 != board2
     board2.add_cards("2c")
     assert board1 == board2
+    assert hash(board1) == hash(board2)
 
 
 def test_value():
@@ -209,6 +212,11 @@ class TestBoardRanking:
         assert self.board_straight.has_straight is True
         assert self.board_trips.has_straight is False
 
+    def test_straights_dont_wrap_around(self):
+        for board in (Board("Ac2d3c4cKc"), Board("QcKdAh2s3c")):
+            assert board.has_straight is False
+            assert board.best_ranking == 0
+
     def test_has_flush(self):
         board = Board("Ac4c5c6c")
         assert board.has_flush is False
@@ -275,3 +283,55 @@ def test_possible_straights():
 
     board = Board("6s4s7s")
     assert board.get_possible_straights(num_cards=2) == [[Rank("3"), Rank("5")], [Rank("5"), Rank("8")]]
+
+
+def test_possible_straights_only_list_missing_ranks():
+    board = Board("Jd9sTc8d")
+    assert board.get_possible_straights(num_cards=1) == [[Rank("7")], [Rank("Q")]]
+    assert board.get_possible_straights(num_cards=2) == [[Rank("6"), Rank("7")], [Rank("Q"), Rank("K")]]
+
+    board = Board("QcKdAh2s3c")
+    assert board.get_possible_straights(num_cards=1) == []
+    assert board.get_possible_straights(num_cards=2) == [[Rank("4"), Rank("5")], [Rank("T"), Rank("J")]]
+
+
+def test_classify_batch():
+    np = pytest.importorskip("numpy")
+    boards = ["AcKdQhJs", "AcKcKdQd", "AcKcQdQhKh", "2c2d2h", "AcKcQdJhTh", "8s7s6s5sTs",
+              "2c2d2hKcKh", "2c2d2h2s", "AcKcQcJcTc", "Ac2c3c4c5c", "Ac2d3c4cKc"]
+    packed = Board.pack(boards)
+    assert packed.dtype == np.uint64
+    result = Board.classify_batch(packed)
+    assert result.dtype == np.uint8
+    assert result.tolist() == [Board(board).best_ranking for board in boards]
+
+
+def test_classify_batch_random_boards():
+    pytest.importorskip("numpy")
+    rand = random.Random(42)
+    cards = [card.value for card in Card]
+    boards = ["".join(rand.sample(cards, rand.choice((3, 4, 5)))) for _ in range(1000)]
+    result = Board.classify_batch(Board.pack(boards))
+    assert result.tolist() == [Board(board).best_ranking for board in boards]
+
+
+def test_pack():
+    pytest.importorskip("numpy")
+    boards = ["AcKdQh", "ackdqh", "A♣KdQh", Board("KdQhAc")]
+    assert len(set(Board.pack(boards).tolist())) == 1
+    assert Board.pack(["2c3c4c5c6c"]).tolist() == [0b11111]
+    with pytest.raises(ValueError):
+        Board.pack(["AcKdQh", "AcAdAc"])
+    with pytest.raises(ValueError):
+        Board.pack(["AcKdQk"])
+
+
+def test_freeze():
+    board = Board.freeze("AsKcQh")
+    assert board == Board("AsKcQh")
+    assert Board.freeze("qhasKC") is board
+    assert Board.freeze(Board("KcQhAs")) is board
+    assert Board.freeze("AsKcQh2c") is not board
+    with pytest.raises(ValueError):
+        board.add_cards("2c")
+    assert len(board) == 3
@@ -1,3 +1,4 @@
+import weakref
 import pytest
 from poker.card import Card, Rank, Suit
 
@@ -115,6 +116,12 @@ def test_passing_Card_instance_to__init__():
     assert repr(c2) == "Card('A♠')"
 
 
+def test_same_cards_are_the_same_instance():
+    assert Card("As") is Card("As")
+    assert Card("as") is Card("AS") is Card("A♠")
+    assert Card("As") is not Card("Ah")
+
+
 def test_make_random_is_instance_of_Card_Rank_and_Suit():
     card = Card.make_random()
     assert isinstance(card, Card)
@@ -144,3 +151,11 @@ def test_putting_them_in_set_doesnt_raise_Exception():
 
 def test_value():
     assert Card("As").value == "As"
+
+
+def test_weakref_without_instance_dict():
+    obj = Card("As")
+    assert weakref.ref(obj)() is obj
+    # there is no instance __dict__, only slots
+    with pytest.raises(AttributeError):
+        obj.new_attribute = 1
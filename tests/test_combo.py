@@ -1,3 +1,4 @@
+import weakref
 import pytest
 from poker.card import Card
 from poker.hand import Shape, Hand, Combo
@@ -163,6 +164,12 @@ def test_shape_property():
     assert Combo("AdKs").shape == Shape.OFFSUIT
 
 
+def test_shape_setter():
+    combo = Combo("AsKd")
+    combo.shape = "o"
+    assert combo._shape == "o"
+
+
 def test_to_hand_converter_method():
     assert Combo("2s2c").to_hand() == Hand("22")
     assert Combo("AsKc").to_hand() == Hand("AKo")
@@ -177,3 +184,11 @@ def test_value():
     assert Combo("2s2c").value == "2s2c"
     assert Combo("KhAs").value == "AsKh"
     assert Combo("ThTd").value == "ThTd"
+
+
+def test_weakref_without_instance_dict():
+    obj = Combo("AsKd")
+    assert weakref.ref(obj)() is obj
+    # there is no instance __dict__, only slots
+    with pytest.raises(AttributeError):
+        obj.new_attribute = 1
@@ -1,3 +1,4 @@
+import weakref
 import pytest
 from poker import Hand, Combo, Rank
 
@@ -205,3 +206,11 @@ def test_suited_hand_to_combos():
         Combo("7h6h"),
         Combo("7s6s"),
     )
+
+
+def test_weakref_without_instance_dict():
+    obj = Hand("AKs")
+    assert weakref.ref(obj)() is obj
+    # there is no instance __dict__, only slots
+    with pytest.raises(AttributeError):
+        obj.new_attribute = 1